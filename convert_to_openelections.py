@@ -1,8 +1,13 @@
 import argparse
+import codecs
 import csv
-import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
 
 YEAR_TO_ELECTION_DATE = {
     1986: "19861104",
@@ -23,6 +28,17 @@ YEAR_TO_ELECTION_DATE = {
     2024: "20241105",
 }
 
+FIELDNAMES = (
+    "county",
+    "precinct",
+    "office",
+    "district",
+    "party",
+    "candidate",
+    "votes",
+    "winner",
+)
+
 OFFICE_CLEANUPS = {
     "President and Vice President of the United States": "President",
     "President / Vice President": "President",
@@ -63,15 +79,21 @@ COUNTY_CODE_TO_NAME = {
     "24": "Worcester",
 }
 
+_VOTE_FOR_RE = re.compile(r"\s*-\s*\(?Vote For.*$", re.I)
+_COUNTY_SUFFIX_RE = re.compile(r"\s+County$", re.I)
+_CITY_SUFFIX_RE = re.compile(r"\s+city$", re.I)
+_FILENAME_RE = re.compile(r"^(\d{4})\s+General\s+Election\.(csv|txt)$", re.I)
+
 
+@lru_cache(maxsize=2048)
 def normalize_office(raw: str) -> str:
     office = raw.strip().strip('"')
-    office = re.sub(r"\s*-\s*Vote For.*$", "", office, flags=re.I)
-    office = re.sub(r"\s*-\s*\(Vote for.*$", "", office, flags=re.I)
+    office = _VOTE_FOR_RE.sub("", office)
     office = office.strip(" -")
     return OFFICE_CLEANUPS.get(office, office)
 
 
+@lru_cache(maxsize=2048)
 def parse_candidate(cell: str) -> tuple[str, str, str]:
     text = cell.strip().strip('"')
     winner = ""
@@ -81,45 +103,71 @@ def parse_candidate(cell: str) -> tuple[str, str, str]:
         text = text[:-7].rstrip()
 
     party = ""
-    match = re.search(r"\(([^()]*)\)\s*$", text)
-    if match:
-        party = match.group(1).strip()
-        candidate = text[:match.start()].strip()
-    else:
-        candidate = text
-
-    candidate = re.sub(r"\s+", " ", candidate).strip()
-    party = re.sub(r"\s+", " ", party).strip()
+    candidate = text
+    tail = text.rstrip()
+    if tail.endswith(")"):
+        lp = tail.rfind("(")
+        inner = tail[lp + 1:-1]
+        if lp != -1 and ")" not in inner:
+            party = inner.strip()
+            candidate = tail[:lp].strip()
+
+    candidate = " ".join(candidate.split())
+    party = " ".join(party.split())
     return candidate, party, winner
 
 
+@lru_cache(maxsize=2048)
 def normalize_county(raw: str) -> str:
     county = raw.strip().strip('"').strip()
-    county = re.sub(r"\s+County$", "", county, flags=re.I)
-    county = re.sub(r"\s+city$", " City", county, flags=re.I)
+    county = _COUNTY_SUFFIX_RE.sub("", county)
+    county = _CITY_SUFFIX_RE.sub(" City", county)
     county = COUNTY_FIXES.get(county, county)
     county = county.replace("`", "'")
     return county
 
 
-def read_text_with_fallback(path: Path) -> str:
-    for encoding in ("utf-8-sig", "cp1252", "latin-1"):
+def sniff_encoding(path: Path) -> str:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with path.open("rb") as f:
         try:
-            return path.read_text(encoding=encoding)
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
         except UnicodeDecodeError:
-            continue
-    # Last attempt, surface the real error context.
-    return path.read_text(encoding="utf-8-sig")
+            return "cp1252"
+    return "utf-8-sig"
+
+
+def open_csv_with_fallback(path: Path) -> TextIO:
+    encoding = sniff_encoding(path)
+    # cp1252 leaves a handful of bytes undefined; replace those instead of failing.
+    errors = "replace" if encoding == "cp1252" else "strict"
+    return path.open("r", encoding=encoding, errors=errors, newline="")
+
+
+def _at_most_one_nonempty(cells: Iterable[str]) -> bool:
+    seen = False
+    for cell in cells:
+        if cell:
+            if seen:
+                return False
+            seen = True
+    return True
 
 
 def convert_csv_style_file(input_path: Path, output_path: Path) -> int:
-    rows_out = []
+    row_count = 0
     office = None
     candidates = []
 
-    text = read_text_with_fallback(input_path)
-    with io.StringIO(text, newline="") as f:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open_csv_with_fallback(input_path) as f, output_path.open(
+        "w", encoding="utf-8", newline=""
+    ) as out:
         reader = csv.reader(f)
+        writer = csv.writer(out)
+        writer.writerow(FIELDNAMES)
 
         for row in reader:
             row = [x.strip() for x in row]
@@ -130,17 +178,8 @@ def convert_csv_style_file(input_path: Path, output_path: Path) -> int:
 
             if (
                 first
-                and len([x for x in row[1:] if x]) <= 1
-                and any(
-                    marker in first
-                    for marker in (
-                        "Vote For",
-                        "Vote for",
-                        "Vote For One",
-                        "Vote For One Pair",
-                        "Vote for One Pair",
-                    )
-                )
+                and _at_most_one_nonempty(islice(row, 1, None))
+                and "vote for" in first.lower()
             ):
                 office = normalize_office(first)
                 candidates = []
@@ -162,77 +201,75 @@ def convert_csv_style_file(input_path: Path, output_path: Path) -> int:
                 for idx, (candidate, party, winner) in enumerate(candidates, start=1):
                     if idx >= len(row):
                         continue
-                    vote_cell = row[idx].strip().strip('"')
-                    if vote_cell == "":
+                    # Cells were already whitespace-stripped when the row was read.
+                    vote_cell = row[idx].strip('"')
+                    if not vote_cell:
                         continue
-                    vote_cell = vote_cell.replace(",", "")
-                    try:
+                    if "," in vote_cell:
+                        vote_cell = vote_cell.replace(",", "")
+                    if vote_cell.isdecimal():
                         votes = int(vote_cell)
-                    except ValueError:
-                        continue
-
-                    rows_out.append(
-                        {
-                            "county": county,
-                            "precinct": "",
-                            "office": office,
-                            "district": "",
-                            "party": party,
-                            "candidate": candidate,
-                            "votes": votes,
-                            "winner": winner,
-                        }
+                    else:
+                        try:
+                            votes = int(vote_cell)
+                        except ValueError:
+                            continue
+
+                    writer.writerow(
+                        (county, "", office, "", party, candidate, votes, winner)
                     )
+                    row_count += 1
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "county",
-                "precinct",
-                "office",
-                "district",
-                "party",
-                "candidate",
-                "votes",
-                "winner",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(rows_out)
-
-    return len(rows_out)
+    return row_count
 
 
-def convert_pipe_style_file(input_path: Path, output_path: Path) -> int:
-    rows_out = []
+def iter_pipe_records(input_path: Path) -> Iterator[tuple[str, ...]]:
     with input_path.open("r", encoding="utf-8-sig", newline="") as f:
         for line in f:
-            raw = line.rstrip("\n")
-            if not raw.strip():
-                continue
-
-            parts = [p.strip() for p in raw.split("|")]
+            parts = line.split("|")
             if len(parts) < 10:
                 continue
+            yield (
+                parts[0].strip(),
+                parts[2].strip(),
+                parts[3].strip(),
+                parts[4].strip(),
+                parts[5].strip(),
+                parts[6].strip(),
+                parts[7].strip(),
+                parts[9].strip(),
+            )
 
-            office_raw = parts[0]
-            county_raw = parts[2]
-            last = parts[3]
-            middle = parts[4]
-            first = parts[5]
-            party = parts[6]
-            winner_flag = parts[7]
-            votes_raw = parts[9]
 
+def convert_pipe_style_file(input_path: Path, output_path: Path) -> int:
+    row_count = 0
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(FIELDNAMES)
+
+        for (
+            office_raw,
+            county_raw,
+            last,
+            middle,
+            first,
+            party,
+            winner_flag,
+            votes_raw,
+        ) in iter_pipe_records(input_path):
             if votes_raw in ("", r"\N"):
                 continue
 
-            try:
-                votes = int(votes_raw.replace(",", ""))
-            except ValueError:
-                continue
+            if "," in votes_raw:
+                votes_raw = votes_raw.replace(",", "")
+            if votes_raw.isdecimal():
+                votes = int(votes_raw)
+            else:
+                try:
+                    votes = int(votes_raw)
+                except ValueError:
+                    continue
 
             name_parts = [x for x in (first, middle, last) if x and x != r"\N"]
             candidate = " ".join(name_parts).strip()
@@ -245,132 +282,139 @@ def convert_pipe_style_file(input_path: Path, output_path: Path) -> int:
             party = "" if party == r"\N" else party
             winner = "TRUE" if winner_flag == "1" else ""
 
-            rows_out.append(
-                {
-                    "county": normalize_county(county_raw),
-                    "precinct": "",
-                    "office": normalize_office(office_raw),
-                    "district": "",
-                    "party": party,
-                    "candidate": candidate,
-                    "votes": votes,
-                    "winner": winner,
-                }
+            writer.writerow(
+                (
+                    normalize_county(county_raw),
+                    "",
+                    normalize_office(office_raw),
+                    "",
+                    party,
+                    candidate,
+                    votes,
+                    winner,
+                )
             )
+            row_count += 1
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "county",
-                "precinct",
-                "office",
-                "district",
-                "party",
-                "candidate",
-                "votes",
-                "winner",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(rows_out)
-    return len(rows_out)
+    return row_count
 
 
 def parse_int(value: str) -> int:
     if value is None:
         return 0
-    text = str(value).strip().strip('"')
+    text = value if type(value) is str else str(value)
     if not text:
         return 0
-    text = text.replace(",", "")
+    if text.isdecimal():
+        return int(text)
+    if '"' in text:
+        text = text.strip().strip('"')
+    if "," in text:
+        text = text.replace(",", "")
+    if text[:1] == "-" and text[1:].isdecimal():
+        return int(text)
     try:
         return int(text)
     except ValueError:
         return 0
 
 
+def _cell(row: list[str], index: int) -> str:
+    return row[index] if 0 <= index < len(row) else ""
+
+
 def convert_modern_precinct_csv(input_path: Path, output_path: Path) -> int:
-    rows_out = []
-    text = read_text_with_fallback(input_path)
-    with io.StringIO(text, newline="") as f:
-        reader = csv.DictReader(f)
-        if not reader.fieldnames:
+    row_count = 0
+    with open_csv_with_fallback(input_path) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
             return 0
 
+        columns = {h.strip().strip('"'): i for i, h in enumerate(header)}
+        i_county_name = columns.get("County Name", -1)
+        i_county_code = columns.get("County", -1)
+        i_ep = columns.get("Election District - Precinct", -1)
+        i_ed = columns.get("Election District", -1)
+        i_pr = columns.get("Election Precinct", -1)
+        i_office = columns.get("Office Name", -1)
+        i_district = columns.get("Office District", -1)
+        i_candidate = columns.get("Candidate Name", -1)
+        i_party = columns.get("Party", -1)
+        i_winner = columns.get("Winner", -1)
         vote_columns = [
-            c for c in reader.fieldnames
-            if c and "Votes" in c and "Against" not in c
+            i for i, h in enumerate(header)
+            if h and "Votes" in h and "Against" not in h
         ]
 
-        for row in reader:
-            county_name = (row.get("County Name") or "").strip()
-            county_code = (row.get("County") or "").strip().zfill(2)
-            if not county_name:
-                county_name = COUNTY_CODE_TO_NAME.get(county_code, county_code)
-            county = normalize_county(county_name)
-
-            precinct = ""
-            ep = (row.get("Election District - Precinct") or "").strip()
-            if ep:
-                precinct = ep
-            else:
-                ed = (row.get("Election District") or "").strip()
-                pr = (row.get("Election Precinct") or "").strip()
-                if ed or pr:
-                    precinct = f"{ed}-{pr}"
-
-            office = normalize_office((row.get("Office Name") or "").strip())
-            district = (row.get("Office District") or "").strip().strip('"')
-            candidate = (row.get("Candidate Name") or "").strip().strip('"')
-            party = (row.get("Party") or "").strip().strip('"')
-            winner_cell = (row.get("Winner") or "").strip().upper()
-            winner = "TRUE" if winner_cell in {"Y", "TRUE", "1"} else ""
-
-            votes = sum(parse_int(row.get(col, "")) for col in vote_columns)
-
-            rows_out.append(
-                {
-                    "county": county,
-                    "precinct": precinct,
-                    "office": office,
-                    "district": district,
-                    "party": party,
-                    "candidate": candidate,
-                    "votes": votes,
-                    "winner": winner,
-                }
-            )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("w", encoding="utf-8", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(FIELDNAMES)
+
+            for row in reader:
+                if not row:
+                    continue
+
+                county_name = _cell(row, i_county_name).strip()
+                county_code = _cell(row, i_county_code).strip().zfill(2)
+                if not county_name:
+                    county_name = COUNTY_CODE_TO_NAME.get(county_code, county_code)
+                county = normalize_county(county_name)
+
+                precinct = ""
+                ep = _cell(row, i_ep).strip()
+                if ep:
+                    precinct = ep
+                else:
+                    ed = _cell(row, i_ed).strip()
+                    pr = _cell(row, i_pr).strip()
+                    if ed or pr:
+                        precinct = f"{ed}-{pr}"
+
+                office = normalize_office(_cell(row, i_office).strip())
+                district = _cell(row, i_district).strip().strip('"')
+                candidate = _cell(row, i_candidate).strip().strip('"')
+                party = _cell(row, i_party).strip().strip('"')
+                winner_cell = _cell(row, i_winner).strip().upper()
+                winner = "TRUE" if winner_cell in {"Y", "TRUE", "1"} else ""
+
+                votes = 0
+                width = len(row)
+                for i in vote_columns:
+                    if i < width and row[i]:
+                        votes += parse_int(row[i])
+
+                writer.writerow(
+                    (county, precinct, office, district, party, candidate, votes, winner)
+                )
+                row_count += 1
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "county",
-                "precinct",
-                "office",
-                "district",
-                "party",
-                "candidate",
-                "votes",
-                "winner",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(rows_out)
-    return len(rows_out)
+    return row_count
 
 
 def detect_csv_format(input_path: Path) -> str:
-    text = read_text_with_fallback(input_path)
-    with io.StringIO(text, newline="") as f:
-        reader = csv.reader(f)
-        header = next(reader, [])
-    normalized = {h.strip().strip('"') for h in header}
-    if "Candidate Name" in normalized and "Office Name" in normalized:
-        return "modern"
+    header = []
+    for encoding, errors in (("utf-8-sig", "strict"), ("cp1252", "replace")):
+        try:
+            with input_path.open(
+                "r", encoding=encoding, errors=errors, newline=""
+            ) as f:
+                header = next(csv.reader(f), [])
+            break
+        except UnicodeDecodeError:
+            continue
+    seen_candidate = seen_office = False
+    for h in header:
+        h = h.strip().strip('"')
+        if h == "Candidate Name":
+            seen_candidate = True
+        elif h == "Office Name":
+            seen_office = True
+        else:
+            continue
+        if seen_candidate and seen_office:
+            return "modern"
     return "legacy"
 
 
@@ -384,7 +428,7 @@ def convert_file(input_path: Path, output_path: Path) -> int:
 
 
 def build_output_name(input_name: str) -> str:
-    m = re.match(r"^(\d{4})\s+General\s+Election\.(csv|txt)$", input_name, flags=re.I)
+    m = _FILENAME_RE.match(input_name)
     if not m:
         raise ValueError(f"Unrecognized filename format: {input_name}")
     year = int(m.group(1))
@@ -394,6 +438,11 @@ def build_output_name(input_name: str) -> str:
     return f"{date_part}__md__general__county.csv"
 
 
+def _convert_one(task: tuple[Path, Path]) -> int:
+    input_path, output_path = task
+    return convert_file(input_path, output_path)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Convert historical Maryland general election files into OpenElections-style county CSVs."
@@ -408,6 +457,12 @@ def main() -> None:
         default="Data/openelections",
         help="Directory for converted OpenElections-style CSVs.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to convert in parallel (default: CPU count).",
+    )
     args = parser.parse_args()
 
     data_dir = Path(args.data_dir)
@@ -415,14 +470,19 @@ def main() -> None:
 
     input_paths = sorted(
         p for p in data_dir.iterdir()
-        if p.is_file() and re.match(r"^\d{4}\s+General\s+Election\.(csv|txt)$", p.name, flags=re.I)
+        if p.is_file() and _FILENAME_RE.match(p.name)
     )
 
-    for input_path in input_paths:
-        output_name = build_output_name(input_path.name)
-        output_path = output_dir / output_name
-        row_count = convert_file(input_path, output_path)
-        print(f"Wrote {output_path} ({row_count} rows)")
+    tasks = [(p, output_dir / build_output_name(p.name)) for p in input_paths]
+
+    if args.jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            print(f"Wrote {task[1]} ({_convert_one(task)} rows)")
+        return
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        for (_, output_path), row_count in zip(tasks, executor.map(_convert_one, tasks)):
+            print(f"Wrote {output_path} ({row_count} rows)")
 
 
 if __name__ == "__main__":